@@ -0,0 +1,17 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class CoreConfig(AppConfig):
+    name = 'apps.core'
+    verbose_name = 'Core'
+    
+    def ready(self):
+        """
+        Create the log directory used by the file handlers
+        
+        The file handlers open lazily (delay=True), so the directory
+        only has to exist before the first record is written. Images
+        built from the Dockerfile already contain it.
+        """
+        (settings.BASE_DIR / 'logs').mkdir(exist_ok=True)
@@ -0,0 +1,47 @@
+"""
+Core Tests
+Location: apps/core/tests.py
+
+Tests for project-wide wiring: cached API schema responses.
+"""
+
+from django.core.cache import caches
+from django.core.cache.backends.redis import RedisSerializer
+from django.test import RequestFactory, TestCase
+from django.utils.cache import get_cache_key
+from rest_framework import status
+
+SCHEMA_JSON_URL = '/swagger.json'
+
+
+class SchemaCacheTest(TestCase):
+    """Test swagger schema responses are cached on the 'schema' alias"""
+    
+    def setUp(self):
+        """Start every test with empty caches"""
+        caches['default'].clear()
+        caches['schema'].clear()
+    
+    def test_swagger_json_served_twice(self):
+        """Test the schema is cached on first fetch and reused"""
+        first = self.client.get(SCHEMA_JSON_URL)
+        second = self.client.get(SCHEMA_JSON_URL)
+        
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.content, first.content)
+        
+        request = RequestFactory().get(SCHEMA_JSON_URL)
+        cache_key = get_cache_key(
+            request,
+            key_prefix='swagger',
+            cache=caches['schema']
+        )
+        self.assertIsNotNone(cache_key)
+        cached = caches['schema'].get(cache_key)
+        self.assertIsNotNone(cached)
+        
+        # Round-trip the stored response the way the Redis backend does
+        serializer = RedisSerializer()
+        restored = serializer.loads(serializer.dumps(cached))
+        self.assertEqual(restored.content, first.content)
@@ -1,8 +1,11 @@
 from rest_framework import generics, status
+from rest_framework.parsers import FormParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.shortcuts import get_object_or_404
 
+from utils.parsers import ORJSONParser
+
 from .models import Payment, PaymentLog
 from .serializers import PaymentSerializer, PaymentCreateSerializer
 from .strategies import StripePaymentStrategy, BkashPaymentStrategy
@@ -79,6 +82,9 @@ class PaymentWebhookView(APIView):
     """
     Handle webhook from payment providers
     """
+    # Provider callbacks may be form-encoded as well as JSON
+    parser_classes = [ORJSONParser, FormParser]
+    
     def post(self, request, provider):
         payment_id = request.data.get('payment_id') or request.data.get('id')
         if not payment_id:
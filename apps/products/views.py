@@ -7,6 +7,7 @@ Views for products and categories with Redis caching.
 
 from rest_framework import viewsets, status, filters
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
@@ -28,6 +29,7 @@ from .serializers import (
     ProductSearchSerializer
 )
 from apps.users.permissions import IsAdmin
+from utils.parsers import ORJSONParser
 
 logger = logging.getLogger(__name__)
 
@@ -424,6 +426,8 @@ class ProductImageViewSet(viewsets.ModelViewSet):
     queryset = ProductImage.objects.all()
     serializer_class = ProductImageSerializer
     permission_classes = [IsAuthenticated, IsAdmin]
+    # Image files arrive as multipart uploads
+    parser_classes = [ORJSONParser, MultiPartParser]
     
     def get_queryset(self):
         """Filter images by product if provided"""
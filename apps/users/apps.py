@@ -8,4 +8,4 @@ class UsersConfig(AppConfig):
     
     def ready(self):
         """Import signals or other startup code here"""
-        pass
\ No newline at end of file
+        from . import signals  # noqa: F401
\ No newline at end of file
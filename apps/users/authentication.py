@@ -0,0 +1,75 @@
+"""
+User Management Authentication
+Location: apps/users/authentication.py
+
+JWT authentication that caches the resolved user between requests.
+"""
+
+from django.core.cache import caches
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+# Short TTL bounds staleness for changes made outside the ORM signals
+USER_CACHE_TTL = 60
+
+# Dedicated alias: User instances are pickled, the default cache uses msgpack
+USER_CACHE_ALIAS = 'auth'
+
+
+def user_cache_key(user_id):
+    """
+    Build the cache key for an authenticated user
+    
+    Args:
+        user_id: Value of the token's user id claim
+        
+    Returns:
+        str: Cache key
+    """
+    return f'user:{user_id}'
+
+
+def invalidate_cached_user(user_id):
+    """
+    Drop a cached user so the next request reloads it
+    
+    Args:
+        user_id: Primary key of the changed user
+    """
+    caches[USER_CACHE_ALIAS].delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that memoizes the token's user in the cache
+    
+    A warm cache skips the per-request SELECT on the users table.
+    Entries are dropped when a user is saved or deleted (see
+    signals.py) and expire after USER_CACHE_TTL seconds otherwise.
+    """
+    
+    def get_user(self, validated_token):
+        """
+        Return the user for a validated token
+        
+        Args:
+            validated_token: Token already checked by simplejwt
+            
+        Returns:
+            User: Active user the token belongs to
+            
+        Raises:
+            InvalidToken: Token carries no user id claim
+            AuthenticationFailed: User missing or inactive
+        """
+        cache = caches[USER_CACHE_ALIAS]
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is not None:
+            user = cache.get(user_cache_key(user_id))
+            if user is not None:
+                return user
+        
+        # Cache miss: simplejwt loads the user and checks it is active
+        user = super().get_user(validated_token)
+        cache.set(user_cache_key(user_id), user, USER_CACHE_TTL)
+        return user
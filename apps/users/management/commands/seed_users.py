@@ -72,15 +72,17 @@ class Command(BaseCommand):
         if not User.objects.filter(email=admin_data['email']).exists():
             admin = User.objects.create_superuser(**admin_data)
             
-            # Create profile
-            UserProfile.objects.create(
+            # Fill in profile (created empty by the post_save signal)
+            UserProfile.objects.update_or_create(
                 user=admin,
-                address_line_1='Admin Office, Level 10',
-                address_line_2='E-Commerce Building',
-                city='Dhaka',
-                state='Dhaka',
-                postal_code='1000',
-                country='Bangladesh'
+                defaults={
+                    'address_line_1': 'Admin Office, Level 10',
+                    'address_line_2': 'E-Commerce Building',
+                    'city': 'Dhaka',
+                    'state': 'Dhaka',
+                    'postal_code': '1000',
+                    'country': 'Bangladesh'
+                }
             )
             
             self.stdout.write(
@@ -161,10 +163,10 @@ class Command(BaseCommand):
                 # Create user
                 user = User.objects.create_user(**user_data)
                 
-                # Create profile
-                UserProfile.objects.create(
+                # Fill in profile (created empty by the post_save signal)
+                UserProfile.objects.update_or_create(
                     user=user,
-                    **profile_data
+                    defaults=profile_data
                 )
                 
                 self.stdout.write(
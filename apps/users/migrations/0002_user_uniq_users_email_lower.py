@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 09:12
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='uniq_users_email_lower', violation_error_message='A user with this email already exists.'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0 on 2026-10-16 09:47
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_uniq_users_email_lower'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='idx_users_email',
+        ),
+    ]
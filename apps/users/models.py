@@ -9,7 +9,9 @@ This module contains User and UserProfile models with OOP principles.
 """
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Lower, Upper
 from django.utils import timezone
 import logging
 
@@ -35,7 +37,7 @@ class UserManager(BaseUserManager):
         user.set_password(password)
         user.save(using=self._db)
         
-        logger.info(f"User created: {email}")
+        logger.info("User created: %s", email)
         return user
     
     
@@ -160,9 +162,41 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name_plural = 'Users'
         ordering = ['-date_joined']
         indexes = [
-            models.Index(fields=['email'], name='idx_users_email'),
+            # Login looks users up by exact email, served by the unique
+            # index on email; no separate email index is needed
             models.Index(fields=['role'], name='idx_users_role'),
             models.Index(fields=['is_active'], name='idx_users_active'),
+            # Newest-first listing; id breaks ties between equal timestamps
+            models.Index(
+                fields=['-date_joined', '-id'],
+                name='idx_users_date_joined'
+            ),
+            # Trigram indexes for UserListView search; SearchFilter's
+            # icontains compiles to UPPER(col) LIKE UPPER('%term%')
+            GinIndex(
+                OpClass(Upper('email'), name='gin_trgm_ops'),
+                name='idx_users_email_trgm'
+            ),
+            GinIndex(
+                OpClass(Upper('first_name'), name='gin_trgm_ops'),
+                name='idx_users_first_name_trgm'
+            ),
+            GinIndex(
+                OpClass(Upper('last_name'), name='gin_trgm_ops'),
+                name='idx_users_last_name_trgm'
+            ),
+            GinIndex(
+                OpClass(Upper('phone'), name='gin_trgm_ops'),
+                name='idx_users_phone_trgm'
+            ),
+        ]
+        constraints = [
+            # Case-insensitive uniqueness; registration relies on it
+            models.UniqueConstraint(
+                Lower('email'),
+                name='uniq_users_email_lower',
+                violation_error_message='A user with this email already exists.'
+            ),
         ]
     
     def __str__(self):
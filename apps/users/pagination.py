@@ -0,0 +1,22 @@
+"""
+User Management Pagination
+Location: apps/users/pagination.py
+
+Pagination classes for user endpoints.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class UserCursorPagination(CursorPagination):
+    """
+    Cursor pagination for the user list
+    
+    Pages are index range scans on idx_users_date_joined, so
+    deep pages cost the same as the first one and no COUNT(*)
+    is issued.
+    """
+    
+    ordering = ('-date_joined', '-id')
+    page_size = 20
+    cursor_query_param = 'cursor'
@@ -6,13 +6,81 @@ This module contains all serializers for user-related API operations.
 Serializers handle data validation, serialization, and deserialization.
 """
 
+import copy
+
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import authenticate
+from django.contrib.auth.hashers import make_password
+from django.db import IntegrityError, transaction
 from .models import User, UserProfile
+from . import validators
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class instead of per instance
+    
+    ModelSerializer.get_fields() introspects the model and builds every
+    field on each instantiation. The result only depends on the class
+    (Meta + declared fields), so it is cached and deep-copied per call;
+    field instances are stateful once bound and must not be shared.
+    """
+    
+    _fields_cache = {}
+    
+    def get_fields(self):
+        """Return a fresh copy of the cached, unbound fields"""
+        cls = type(self)
+        fields = self._fields_cache.get(cls)
+        if fields is None:
+            fields = self._fields_cache[cls] = super().get_fields()
+        return copy.deepcopy(fields)
+
+
+class PlainDictMixin:
+    """
+    Serialize instances into plain dicts instead of OrderedDicts
+    
+    Same loop as Serializer.to_representation; dicts keep insertion
+    order and are cheaper to build and encode.
+    """
+    
+    def to_representation(self, instance):
+        """Object instance -> dict of primitive datatypes"""
+        ret = {}
+        
+        for field in self._readable_fields:
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+            
+            # Skip to_representation for None values, as DRF does
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+        
+        return ret
+
+
+class LowercaseEmailField(serializers.EmailField):
+    """
+    Email field that lowercases its input
+    
+    Emails are stored lowercased, so lookups can match exactly.
+    """
+    
+    def to_internal_value(self, data):
+        """Validate and lowercase email"""
+        return super().to_internal_value(data).lower()
 
 
-class UserProfileSerializer(serializers.ModelSerializer):
+class UserProfileSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for UserProfile model
     
@@ -50,7 +118,7 @@ class UserProfileSerializer(serializers.ModelSerializer):
         return obj.get_age()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(PlainDictMixin, serializers.ModelSerializer):
     """
     Serializer for User model - General purpose
     
@@ -90,6 +158,18 @@ class UserSerializer(serializers.ModelSerializer):
         return obj.get_full_name()
 
 
+class UserRegistrationListSerializer(serializers.ListSerializer):
+    """
+    List serializer for bulk user registration
+    
+    Used by UserRegistrationSerializer(many=True), e.g. admin imports.
+    """
+    
+    def create(self, validated_data):
+        """Create all users in one batch"""
+        return self.child.create_many(validated_data)
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration
@@ -123,60 +203,32 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             'last_name',
             'phone'
         ]
+        list_serializer_class = UserRegistrationListSerializer
         extra_kwargs = {
+            # Uniqueness is enforced by the database on INSERT (see create)
+            'email': {'validators': []},
             'first_name': {'required': True},
             'last_name': {'required': True}
         }
     
     def validate_email(self, value):
         """
-        Validate email uniqueness
+        Normalize email address
+        
+        Uniqueness is not checked here; the case-insensitive unique
+        constraint on User.email rejects duplicates in create().
         
         Args:
             value (str): Email address to validate
             
         Returns:
             str: Lowercased email
-            
-        Raises:
-            ValidationError: If email already exists
         """
-        if User.objects.filter(email__iexact=value).exists():
-            raise serializers.ValidationError(
-                "A user with this email already exists."
-            )
         return value.lower()
     
     def validate_phone(self, value):
-        """
-        Validate phone number format (optional but basic validation)
-        
-        Args:
-            value (str): Phone number to validate
-            
-        Returns:
-            str: Validated phone number
-            
-        Raises:
-            ValidationError: If phone format is invalid
-        """
-        if value:
-            # Remove spaces and dashes
-            cleaned_phone = value.replace(' ', '').replace('-', '')
-            
-            # Check if it contains only digits and optional + at start
-            if not cleaned_phone.replace('+', '').isdigit():
-                raise serializers.ValidationError(
-                    "Phone number must contain only digits."
-                )
-            
-            # Check length (basic validation)
-            if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
-                raise serializers.ValidationError(
-                    "Phone number must be between 10 and 15 digits."
-                )
-        
-        return value
+        """Validate phone number format"""
+        return validators.validate_phone(value)
     
     def validate(self, attrs):
         """
@@ -206,17 +258,71 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             
         Returns:
             User: Created user instance with profile
+            
+        Raises:
+            ValidationError: If email already exists
         """
         # Remove password_confirm as it's not needed
         validated_data.pop('password_confirm')
         
-        # Create user
-        user = User.objects.create_user(**validated_data)
-        
-        # Create associated user profile
-        UserProfile.objects.create(user=user)
+        try:
+            # User and profile (post_save signal) commit together.
+            # Savepoint keeps an outer transaction usable after a duplicate
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'email': 'A user with this email already exists.'
+            })
         
         return user
+    
+    def create_many(self, validated_list):
+        """
+        Create many users with profiles in a single transaction
+        
+        Issues one INSERT for all users and one for all profiles
+        instead of two per user.
+        
+        Args:
+            validated_list (list): Validated data for each user
+            
+        Returns:
+            list: Created user instances
+            
+        Raises:
+            ValidationError: If any email already exists
+        """
+        # Same normalization and hashing as UserManager.create_user,
+        # which bulk_create bypasses
+        users = []
+        for validated_data in validated_list:
+            validated_data = dict(validated_data)
+            validated_data.pop('password_confirm', None)
+            password = validated_data.pop('password')
+            validated_data['email'] = User.objects.normalize_email(
+                validated_data['email']
+            )
+            
+            users.append(User(
+                password=make_password(password),
+                **validated_data
+            ))
+        
+        try:
+            with transaction.atomic():
+                # bulk_create does not send post_save, so add profiles here
+                users = User.objects.bulk_create(users)
+                UserProfile.objects.bulk_create(
+                    [UserProfile(user=user) for user in users],
+                    ignore_conflicts=True
+                )
+        except IntegrityError:
+            raise serializers.ValidationError({
+                'email': 'One or more users with these emails already exist.'
+            })
+        
+        return users
 
 
 class UserLoginSerializer(serializers.Serializer):
@@ -226,7 +332,7 @@ class UserLoginSerializer(serializers.Serializer):
     Validates user credentials and returns authenticated user.
     """
     
-    email = serializers.EmailField(
+    email = LowercaseEmailField(
         required=True,
         help_text='User email address'
     )
@@ -251,37 +357,31 @@ class UserLoginSerializer(serializers.Serializer):
         Raises:
             ValidationError: If credentials are invalid
         """
-        email = attrs.get('email', '').lower()
-        password = attrs.get('password')
+        # Both fields are required and email is already lowercased
+        email, password = attrs['email'], attrs['password']
+        
+        # Authenticate user
+        user = authenticate(
+            request=self.context.get('request'),
+            username=email,
+            password=password
+        )
         
-        if email and password:
-            # Authenticate user
-            user = authenticate(
-                request=self.context.get('request'),
-                username=email,
-                password=password
+        if not user:
+            raise serializers.ValidationError(
+                'Invalid email or password.',
+                code='authorization'
             )
-            
-            if not user:
-                raise serializers.ValidationError(
-                    'Invalid email or password.',
-                    code='authorization'
-                )
-            
-            # Check if user is active
-            if not user.is_active:
-                raise serializers.ValidationError(
-                    'User account is disabled.',
-                    code='authorization'
-                )
-            
-            attrs['user'] = user
-            return attrs
-        else:
+        
+        # Check if user is active
+        if not user.is_active:
             raise serializers.ValidationError(
-                'Must include "email" and "password".',
+                'User account is disabled.',
                 code='authorization'
             )
+        
+        attrs['user'] = user
+        return attrs
 
 
 class ChangePasswordSerializer(serializers.Serializer):
@@ -364,9 +464,13 @@ class ChangePasswordSerializer(serializers.Serializer):
         Returns:
             User: Updated user instance
         """
-        user = self.context['request'].user
-        user.set_password(self.validated_data['new_password'])
-        user.save()
+        with transaction.atomic():
+            # Lock the row so a concurrent profile update can't be lost
+            user = User.objects.select_for_update(of=('self',)).get(
+                pk=self.context['request'].user.pk
+            )
+            user.set_password(self.validated_data['new_password'])
+            user.save(update_fields=['password', 'updated_at'])
         return user
 
 
@@ -391,17 +495,7 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     
     def validate_phone(self, value):
         """Validate phone number format"""
-        if value:
-            cleaned_phone = value.replace(' ', '').replace('-', '')
-            if not cleaned_phone.replace('+', '').isdigit():
-                raise serializers.ValidationError(
-                    "Phone number must contain only digits."
-                )
-            if len(cleaned_phone) < 10 or len(cleaned_phone) > 15:
-                raise serializers.ValidationError(
-                    "Phone number must be between 10 and 15 digits."
-                )
-        return value
+        return validators.validate_phone(value)
     
     def update(self, instance, validated_data):
         """
@@ -417,17 +511,20 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         # Extract profile data if provided
         profile_data = validated_data.pop('profile', None)
         
-        # Update user fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
+        # Update user fields (only the submitted columns are written)
+        if validated_data:
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+            instance.save(update_fields=[*validated_data, 'updated_at'])
         
         # Update profile if data provided
         if profile_data:
-            profile, created = UserProfile.objects.get_or_create(user=instance)
-            for attr, value in profile_data.items():
-                setattr(profile, attr, value)
-            profile.save()
+            profile, created = UserProfile.objects.update_or_create(
+                user=instance,
+                defaults=profile_data
+            )
+            # Keep the cached relation fresh for the response
+            instance.profile = profile
         
         return instance
 
@@ -436,14 +533,15 @@ class UserUpdateSerializer(serializers.ModelSerializer):
 
 
 
-class UserListSerializer(serializers.ModelSerializer):
+class UserListSerializer(PlainDictMixin, CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for user list (minimal information)
     
     Used in list views where we don't need full details.
+    All fields are plain scalars read straight off the model.
     """
     
-    full_name = serializers.SerializerMethodField()
+    full_name = serializers.CharField(source='get_full_name', read_only=True)
     
     class Meta:
         model = User
@@ -456,10 +554,6 @@ class UserListSerializer(serializers.ModelSerializer):
             'date_joined'
         ]
     
-    def get_full_name(self, obj):
-        """Get user's full name"""
-        return obj.get_full_name()
-    
     
     
     
\ No newline at end of file
@@ -0,0 +1,41 @@
+"""
+User Management Signals
+Location: apps/users/signals.py
+
+Signal handlers keeping UserProfile and the auth cache in step
+with User.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_user
+from .models import User, UserProfile
+
+
+@receiver(post_save, sender=User)
+def _ensure_profile(sender, instance, created, raw=False, **kwargs):
+    """
+    Create an empty profile for every newly created user
+    
+    Uses INSERT ... ON CONFLICT DO NOTHING so callers that create
+    the profile themselves (e.g. bulk imports) are not affected.
+    """
+    if created and not raw:
+        UserProfile.objects.bulk_create(
+            [UserProfile(user=instance)],
+            ignore_conflicts=True
+        )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _invalidate_auth_cache(sender, instance, raw=False, **kwargs):
+    """
+    Drop the cached user used by CachedJWTAuthentication
+    
+    Covers profile updates, password changes, deactivation and
+    deletion, whichever view or admin action performs them.
+    """
+    if not raw:
+        invalidate_cached_user(instance.pk)
@@ -8,15 +8,52 @@ Comprehensive test suite for user management functionality.
 Tests models, serializers, views, and API endpoints.
 """
 
-from django.test import TestCase
+import io
+import json
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
 from django.urls import reverse
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APISimpleTestCase, APITestCase
 from rest_framework import status
+from django.core.cache import caches
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
 from django.contrib.auth import get_user_model
+from PIL import Image
+from rest_framework.exceptions import AuthenticationFailed
+from .authentication import (
+    CachedJWTAuthentication,
+    USER_CACHE_ALIAS,
+    user_cache_key,
+)
 from .models import UserProfile
+from .serializers import UserRegistrationSerializer
+from .tokens import issue_token_pair
 
 User = get_user_model()
 
+# Resolved once at import instead of in every setUp
+REGISTER_URL = reverse('users:register')
+LOGIN_URL = reverse('users:login')
+PROFILE_URL = reverse('users:profile')
+CHANGE_PASSWORD_URL = reverse('users:change_password')
+LIST_URL = reverse('users:user_list')
+LOGOUT_URL = reverse('users:logout')
+
+# Valid registration payload shared by the registration test classes
+REGISTRATION_DATA = {
+    'email': 'newuser@example.com',
+    'password': 'SecurePass123!',
+    'password_confirm': 'SecurePass123!',
+    'first_name': 'New',
+    'last_name': 'User',
+    'phone': '01712345678'
+}
+
 
 # ============================================
 # Model Tests
@@ -25,9 +62,10 @@ User = get_user_model()
 class UserModelTest(TestCase):
     """Test User model functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.user_data = {
+        cls.user_data = {
             'email': 'test@example.com',
             'password': 'TestPass123!',
             'first_name': 'Test',
@@ -114,17 +152,21 @@ class UserModelTest(TestCase):
 class UserProfileModelTest(TestCase):
     """Test UserProfile model functionality"""
     
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data"""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             email='test@example.com',
             password='TestPass123!'
         )
-        self.profile = UserProfile.objects.create(
-            user=self.user,
-            address_line_1='123 Main Street',
-            city='Dhaka',
-            country='Bangladesh'
+        # Profile row is created by the post_save signal
+        cls.profile, _ = UserProfile.objects.update_or_create(
+            user=cls.user,
+            defaults={
+                'address_line_1': '123 Main Street',
+                'city': 'Dhaka',
+                'country': 'Bangladesh'
+            }
         )
     
     def test_profile_creation(self):
@@ -133,6 +175,15 @@ class UserProfileModelTest(TestCase):
         self.assertEqual(self.profile.city, 'Dhaka')
         self.assertEqual(self.profile.country, 'Bangladesh')
     
+    def test_profile_created_with_user(self):
+        """Test a profile is created automatically for a new user"""
+        user = User.objects.create_user(
+            email='autoprofile@example.com',
+            password='TestPass123!'
+        )
+        
+        self.assertTrue(UserProfile.objects.filter(user=user).exists())
+    
     def test_profile_str_representation(self):
         """Test profile string representation"""
         expected_str = f"Profile of {self.user.email}"
@@ -174,25 +225,22 @@ class UserProfileModelTest(TestCase):
 class UserRegistrationTest(APITestCase):
     """Test user registration endpoint"""
     
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data and its pre-encoded JSON body"""
+        cls.valid_data = REGISTRATION_DATA
+        cls.valid_body = json.dumps(cls.valid_data).encode()
+    
     def setUp(self):
-        """Set up test client and data"""
-        self.client = APIClient()
-        self.register_url = reverse('users:register')
-        self.valid_data = {
-            'email': 'newuser@example.com',
-            'password': 'SecurePass123!',
-            'password_confirm': 'SecurePass123!',
-            'first_name': 'New',
-            'last_name': 'User',
-            'phone': '01712345678'
-        }
+        """Set up endpoint URL"""
+        self.register_url = REGISTER_URL
     
     def test_register_user_success(self):
         """Test successful user registration"""
         response = self.client.post(
             self.register_url,
-            self.valid_data,
-            format='json'
+            self.valid_body,
+            content_type='application/json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -203,21 +251,36 @@ class UserRegistrationTest(APITestCase):
             self.valid_data['email']
         )
         
-        # Verify user is created in database
-        user_exists = User.objects.filter(
+        # Verify user and profile are created in a single query
+        user = User.objects.select_related('profile').get(
             email=self.valid_data['email']
-        ).exists()
-        self.assertTrue(user_exists)
-        
-        # Verify profile is created
-        user = User.objects.get(email=self.valid_data['email'])
-        self.assertTrue(hasattr(user, 'profile'))
+        )
+        self.assertEqual(user.profile.user_id, user.pk)
     
     
     
 
     
             
+    def test_bulk_register_users(self):
+        """Test bulk registration hashes passwords and creates profiles"""
+        data = [
+            {**self.valid_data, 'email': f'Bulk{i}@Example.COM'}
+            for i in range(3)
+        ]
+        serializer = UserRegistrationSerializer(data=data, many=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        
+        users = serializer.save()
+        
+        self.assertEqual(len(users), 3)
+        for i, user in enumerate(users):
+            user = User.objects.select_related('profile').get(pk=user.pk)
+            self.assertEqual(user.email, f'bulk{i}@example.com')
+            self.assertNotEqual(user.password, self.valid_data['password'])
+            self.assertTrue(user.check_password(self.valid_data['password']))
+            self.assertEqual(user.profile.user_id, user.pk)
+    
     def test_register_duplicate_email(self):
         """Test registration with duplicate email"""
         # প্রথমে একটি user তৈরি করুন
@@ -229,7 +292,7 @@ class UserRegistrationTest(APITestCase):
         )
         
         # সঠিক URL name: namespace + ':' + name
-        url = reverse('users:register')  # ✅ এটাই সঠিক
+        url = REGISTER_URL
         
         data = {
             'email': 'duplicate@example.com',
@@ -249,46 +312,66 @@ class UserRegistrationTest(APITestCase):
                 
             
             
-            
-    def test_register_password_mismatch(self):
-        """Test registration with password mismatch"""
-        data = self.valid_data.copy()
-        data['password_confirm'] = 'DifferentPass123!'
-        
-        response = self.client.post(
-            self.register_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class UserRegistrationValidationTest(APISimpleTestCase):
+    """
+    Test registration validation failures
     
-    def test_register_weak_password(self):
-        """Test registration with weak password"""
-        data = self.valid_data.copy()
-        data['password'] = '123'
-        data['password_confirm'] = '123'
-        
-        response = self.client.post(
-            self.register_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    Every payload here fails serializer validation before a query is
+    issued, so the class runs without database setup or transactions.
+    """
     
-    def test_register_invalid_email(self):
-        """Test registration with invalid email"""
-        data = self.valid_data.copy()
-        data['email'] = 'invalid-email'
+    def setUp(self):
+        """Set up test data"""
+        self.register_url = REGISTER_URL
+        self.valid_data = REGISTRATION_DATA
+    
+    def test_register_invalid_inputs(self):
+        """Test registration rejects each invalid field value"""
+        cases = {
+            'password_mismatch': {'password_confirm': 'DifferentPass123!'},
+            'weak_password': {'password': '123', 'password_confirm': '123'},
+            'invalid_email': {'email': 'invalid-email'},
+        }
         
-        response = self.client.post(
-            self.register_url,
-            data,
-            format='json'
-        )
+        for name, overrides in cases.items():
+            with self.subTest(name):
+                response = self.client.post(
+                    self.register_url,
+                    {**self.valid_data, **overrides},
+                    format='json'
+                )
+                
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
+    
+    def test_register_invalid_phone(self):
+        """Test phone errors name the rule that failed"""
+        cases = {
+            '++8801712345678': 'Phone number must contain only digits.',
+            '017-12a45678': 'Phone number must contain only digits.',
+            '+880171': 'Phone number must be between 10 and 15 digits.',
+        }
         
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for phone, message in cases.items():
+            with self.subTest(phone=phone):
+                response = self.client.post(
+                    self.register_url,
+                    {**self.valid_data, 'phone': phone},
+                    format='json'
+                )
+                
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
+                self.assertEqual(
+                    response.data['error']['details']['phone'],
+                    [message]
+                )
     
     def test_register_missing_required_fields(self):
         """Test registration with missing required fields"""
@@ -310,22 +393,26 @@ Continue adding these test classes to apps/users/tests.py
 class UserLoginTest(APITestCase):
     """Test user login endpoint"""
     
-    def setUp(self):
-        """Set up test client and user"""
-        self.client = APIClient()
-        self.login_url = reverse('users:login')
-        self.user_data = {
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user_data = {
             'email': 'testuser@example.com',
             'password': 'TestPass123!'
         }
-        self.user = User.objects.create_user(**self.user_data)
+        cls.user_body = json.dumps(cls.user_data).encode()
+        cls.user = User.objects.create_user(**cls.user_data)
+    
+    def setUp(self):
+        """Set up endpoint URL"""
+        self.login_url = LOGIN_URL
     
     def test_login_success(self):
         """Test successful login"""
         response = self.client.post(
             self.login_url,
-            self.user_data,
-            format='json'
+            self.user_body,
+            content_type='application/json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -347,6 +434,19 @@ class UserLoginTest(APITestCase):
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
     
+    def test_login_error_body(self):
+        """Test failed login uses the common error body"""
+        response = self.client.post(
+            self.login_url,
+            {'email': self.user_data['email'], 'password': 'Wrong123!'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(response.data['success'])
+        self.assertEqual(response.data['status'], 400)
+        self.assertIn('message', response.data['error'])
+    
     def test_login_nonexistent_user(self):
         """Test login with non-existent user"""
         data = {
@@ -369,8 +469,8 @@ class UserLoginTest(APITestCase):
         
         response = self.client.post(
             self.login_url,
-            self.user_data,
-            format='json'
+            self.user_body,
+            content_type='application/json'
         )
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -392,17 +492,19 @@ class UserLoginTest(APITestCase):
 class UserProfileTest(APITestCase):
     """Test user profile endpoints"""
     
-    def setUp(self):
-        """Set up test client and authenticated user"""
-        self.client = APIClient()
-        self.profile_url = reverse('users:profile')
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user = User.objects.create_user(
             email='testuser@example.com',
             password='TestPass123!',
             first_name='Test',
             last_name='User'
         )
-        UserProfile.objects.create(user=self.user)
+    
+    def setUp(self):
+        """Set up authenticated test client"""
+        self.profile_url = PROFILE_URL
         self.client.force_authenticate(user=self.user)
     
     def test_get_profile(self):
@@ -428,10 +530,10 @@ class UserProfileTest(APITestCase):
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.user.refresh_from_db()
-        self.assertEqual(self.user.first_name, 'Updated')
-        self.assertEqual(self.user.last_name, 'Name')
-        self.assertEqual(self.user.phone, '01812345678')
+        user_data = response.data['user']
+        self.assertEqual(user_data['first_name'], 'Updated')
+        self.assertEqual(user_data['last_name'], 'Name')
+        self.assertEqual(user_data['phone'], '01812345678')
     
     def test_update_profile_address(self):
         """Test updating profile address"""
@@ -451,8 +553,34 @@ class UserProfileTest(APITestCase):
         )
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.user.profile.refresh_from_db()
-        self.assertEqual(self.user.profile.city, 'Chittagong')
+        self.assertEqual(
+            response.data['user']['profile']['city'],
+            'Chittagong'
+        )
+    
+    def test_update_profile_avatar(self):
+        """Test uploading an avatar as multipart form data"""
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        
+        image = io.BytesIO()
+        Image.new('RGB', (1, 1)).save(image, format='PNG')
+        avatar = SimpleUploadedFile(
+            'avatar.png',
+            image.getvalue(),
+            content_type='image/png'
+        )
+        
+        with override_settings(MEDIA_ROOT=media_root):
+            response = self.client.patch(
+                self.profile_url,
+                {'profile.avatar': avatar},
+                format='multipart'
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        profile = UserProfile.objects.get(user=self.user)
+        self.assertTrue(profile.avatar.name.startswith('avatars/'))
     
     def test_profile_unauthorized(self):
         """Test accessing profile without authentication"""
@@ -465,14 +593,17 @@ class UserProfileTest(APITestCase):
 class ChangePasswordTest(APITestCase):
     """Test change password endpoint"""
     
-    def setUp(self):
-        """Set up test client and authenticated user"""
-        self.client = APIClient()
-        self.change_password_url = reverse('users:change_password')
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user = User.objects.create_user(
             email='testuser@example.com',
             password='OldPass123!'
         )
+    
+    def setUp(self):
+        """Set up authenticated test client"""
+        self.change_password_url = CHANGE_PASSWORD_URL
         self.client.force_authenticate(user=self.user)
     
     def test_change_password_success(self):
@@ -492,92 +623,79 @@ class ChangePasswordTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password('NewPass123!'))
+
+
+class ChangePasswordValidationTest(APISimpleTestCase):
+    """
+    Test change password validation failures
     
-    def test_change_password_wrong_old_password(self):
-        """Test password change with wrong old password"""
-        data = {
-            'old_password': 'WrongOldPass123!',
-            'new_password': 'NewPass123!',
-            'new_password_confirm': 'NewPass123!'
-        }
-        
-        response = self.client.post(
-            self.change_password_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    These requests are rejected by the serializer before anything is
+    written, so an unsaved user is enough and no database is needed.
+    """
     
-    def test_change_password_mismatch(self):
-        """Test password change with new password mismatch"""
-        data = {
-            'old_password': 'OldPass123!',
-            'new_password': 'NewPass123!',
-            'new_password_confirm': 'DifferentPass123!'
-        }
-        
-        response = self.client.post(
-            self.change_password_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    def setUp(self):
+        """Set up client authenticated as an unsaved user"""
+        self.user = User(email='testuser@example.com')
+        self.user.set_password('OldPass123!')
+        self.change_password_url = CHANGE_PASSWORD_URL
+        self.client.force_authenticate(user=self.user)
     
-    def test_change_password_same_as_old(self):
-        """Test changing password to same as old"""
-        data = {
+    def test_change_password_invalid_inputs(self):
+        """Test password change rejects each invalid combination"""
+        valid_data = {
             'old_password': 'OldPass123!',
-            'new_password': 'OldPass123!',
-            'new_password_confirm': 'OldPass123!'
+            'new_password': 'NewPass123!',
+            'new_password_confirm': 'NewPass123!'
         }
-        
-        response = self.client.post(
-            self.change_password_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-    
-    def test_change_password_weak_new_password(self):
-        """Test changing to weak password"""
-        data = {
-            'old_password': 'OldPass123!',
-            'new_password': '123',
-            'new_password_confirm': '123'
+        cases = {
+            'wrong_old_password': {'old_password': 'WrongOldPass123!'},
+            'mismatch': {'new_password_confirm': 'DifferentPass123!'},
+            'same_as_old': {
+                'new_password': 'OldPass123!',
+                'new_password_confirm': 'OldPass123!'
+            },
+            'weak_new_password': {
+                'new_password': '123',
+                'new_password_confirm': '123'
+            },
         }
         
-        response = self.client.post(
-            self.change_password_url,
-            data,
-            format='json'
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for name, overrides in cases.items():
+            with self.subTest(name):
+                response = self.client.post(
+                    self.change_password_url,
+                    {**valid_data, **overrides},
+                    format='json'
+                )
+                
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
 
 
 class UserListTest(APITestCase):
     """Test user list endpoint"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = APIClient()
-        self.list_url = reverse('users:user_list')
-        
+    @classmethod
+    def setUpTestData(cls):
+        """Create users once for the class"""
         # Create admin user
-        self.admin = User.objects.create_superuser(
+        cls.admin = User.objects.create_superuser(
             email='admin@example.com',
             password='AdminPass123!'
         )
         
         # Create regular user
-        self.customer = User.objects.create_user(
+        cls.customer = User.objects.create_user(
             email='customer@example.com',
             password='CustomerPass123!'
         )
     
+    def setUp(self):
+        """Set up endpoint URL"""
+        self.list_url = LIST_URL
+    
     def test_list_users_as_admin(self):
         """Test listing users as admin"""
         self.client.force_authenticate(user=self.admin)
@@ -586,10 +704,46 @@ class UserListTest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertGreaterEqual(len(response.data['results']), 2)
     
+    def test_list_users_cursor_pagination(self):
+        """Test user list pages by cursor without a total count"""
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(self.list_url)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', response.data)
+        self.assertIn('next', response.data)
+        self.assertEqual(
+            [user['email'] for user in response.data['results']][:2],
+            [self.customer.email, self.admin.email]
+        )
+    
+    def test_list_users_ordering(self):
+        """Test ?ordering= accepts only cursor-safe fields"""
+        self.client.force_authenticate(user=self.admin)
+        cases = {
+            'date_joined': [self.admin.email, self.customer.email],
+            # Not in ordering_fields: falls back to newest first
+            'email': [self.customer.email, self.admin.email],
+        }
+        for ordering, expected in cases.items():
+            with self.subTest(ordering=ordering):
+                response = self.client.get(
+                    self.list_url,
+                    {'ordering': ordering}
+                )
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [user['email'] for user in response.data['results']],
+                    expected
+                )
+    
     def test_list_users_as_customer(self):
         """Test listing users as regular customer"""
         self.client.force_authenticate(user=self.customer)
-        response = self.client.get(self.list_url)
+        # Answered from request.user without touching the database
+        with self.assertNumQueries(0):
+            response = self.client.get(self.list_url)
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Customer should only see themselves
@@ -599,6 +753,31 @@ class UserListTest(APITestCase):
             self.customer.email
         )
     
+    def test_list_users_as_customer_filtered(self):
+        """Test customer filters still run against the database"""
+        self.client.force_authenticate(user=self.customer)
+        response = self.client.get(self.list_url, {'role': 'admin'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+    
+    def test_list_users_as_customer_with_params(self):
+        """Test customer requests with parameters take the cursor path"""
+        self.client.force_authenticate(user=self.customer)
+        for params in (
+            {'role': 'customer'},
+            {'search': 'customer'},
+            {'format': 'json'},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.list_url, params)
+                
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(
+                    [user['email'] for user in response.data['results']],
+                    [self.customer.email]
+                )
+    
     def test_list_users_unauthorized(self):
         """Test listing users without authentication"""
         response = self.client.get(self.list_url)
@@ -609,20 +788,21 @@ class UserListTest(APITestCase):
 class UserLogoutTest(APITestCase):
     """Test user logout endpoint"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = APIClient()
-        self.logout_url = reverse('users:logout')
-        self.user = User.objects.create_user(
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user = User.objects.create_user(
             email='testuser@example.com',
             password='TestPass123!'
         )
-        self.client.force_authenticate(user=self.user)
         
-        # Get refresh token
-        from rest_framework_simplejwt.tokens import RefreshToken
-        refresh = RefreshToken.for_user(self.user)
-        self.refresh_token = str(refresh)
+        # Signed once; blacklisting in a test is rolled back afterwards
+        cls.refresh_token = str(RefreshToken.for_user(cls.user))
+    
+    def setUp(self):
+        """Set up authenticated test client"""
+        self.logout_url = LOGOUT_URL
+        self.client.force_authenticate(user=self.user)
     
     def test_logout_success(self):
         """Test successful logout"""
@@ -646,6 +826,35 @@ class UserLogoutTest(APITestCase):
         # Should still return 200 (graceful handling)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
     
+    def test_logout_non_object_body(self):
+        """Test logout rejects JSON bodies that are not objects"""
+        for body in (b'["token"]', b'"token"'):
+            with self.subTest(body=body):
+                response = self.client.post(
+                    self.logout_url,
+                    body,
+                    content_type='application/json'
+                )
+                
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST
+                )
+                self.assertIn(
+                    'Expected a dictionary',
+                    response.data['error']['details']['non_field_errors'][0]
+                )
+    
+    def test_logout_invalid_token(self):
+        """Test logout with a malformed refresh token"""
+        response = self.client.post(
+            self.logout_url,
+            {'refresh_token': 'not-a-token'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
     def test_logout_unauthorized(self):
         """Test logout without authentication"""
         self.client.force_authenticate(user=None)
@@ -656,4 +865,107 @@ class UserLogoutTest(APITestCase):
         )
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-        
\ No newline at end of file
+        
+
+
+class IssueTokenPairTest(TestCase):
+    """Test the token pair issued by register and login"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user = User.objects.create_user(
+            email='tokens@example.com',
+            password='TestPass123!'
+        )
+    
+    def test_token_pair_claims(self):
+        """Test both tokens decode with the claims for_user sets"""
+        access, refresh = issue_token_pair(self.user)
+        
+        access = AccessToken(access)
+        refresh = RefreshToken(refresh)
+        user_id_claim = jwt_settings.USER_ID_CLAIM
+        
+        self.assertEqual(access[jwt_settings.TOKEN_TYPE_CLAIM], 'access')
+        self.assertEqual(refresh[jwt_settings.TOKEN_TYPE_CLAIM], 'refresh')
+        self.assertEqual(access[user_id_claim], self.user.pk)
+        self.assertEqual(refresh[user_id_claim], self.user.pk)
+        self.assertNotEqual(
+            access[jwt_settings.JTI_CLAIM],
+            refresh[jwt_settings.JTI_CLAIM]
+        )
+        self.assertEqual(
+            refresh['exp'] - refresh['iat'],
+            jwt_settings.REFRESH_TOKEN_LIFETIME.total_seconds()
+        )
+        self.assertEqual(
+            access['exp'] - access['iat'],
+            jwt_settings.ACCESS_TOKEN_LIFETIME.total_seconds()
+        )
+    
+    def test_refresh_token_recorded(self):
+        """Test the refresh token is stored as outstanding for logout"""
+        _, refresh = issue_token_pair(self.user)
+        
+        jti = RefreshToken(refresh)[jwt_settings.JTI_CLAIM]
+        self.assertTrue(
+            OutstandingToken.objects.filter(user=self.user, jti=jti).exists()
+        )
+
+
+class CachedJWTAuthenticationTest(TestCase):
+    """Test cached user lookup for JWT authentication"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create test user once for the class"""
+        cls.user = User.objects.create_user(
+            email='cached@example.com',
+            password='TestPass123!'
+        )
+    
+    def setUp(self):
+        """Start every test with an empty auth cache"""
+        caches[USER_CACHE_ALIAS].clear()
+        self.auth = CachedJWTAuthentication()
+        self.token = AccessToken.for_user(self.user)
+    
+    def test_cache_miss_loads_user(self):
+        """Test first lookup queries the database and fills the cache"""
+        with self.assertNumQueries(1):
+            user = self.auth.get_user(self.token)
+        
+        self.assertEqual(user.pk, self.user.pk)
+        cached = caches[USER_CACHE_ALIAS].get(user_cache_key(self.user.pk))
+        self.assertEqual(cached.pk, self.user.pk)
+    
+    def test_user_served_from_cache(self):
+        """Test second lookup does not query the database"""
+        self.auth.get_user(self.token)
+        
+        with self.assertNumQueries(0):
+            user = self.auth.get_user(self.token)
+        
+        self.assertEqual(user.pk, self.user.pk)
+    
+    def test_cache_invalidated_on_save(self):
+        """Test saving the user drops the cached copy"""
+        self.auth.get_user(self.token)
+        self.user.first_name = 'Changed'
+        self.user.save()
+        
+        with self.assertNumQueries(1):
+            user = self.auth.get_user(self.token)
+        
+        self.assertEqual(user.first_name, 'Changed')
+    
+    def test_cache_invalidated_on_delete(self):
+        """Test a deleted user is not served from the cache"""
+        user_id = self.user.pk
+        self.auth.get_user(self.token)
+        self.user.delete()
+        
+        self.assertIsNone(caches[USER_CACHE_ALIAS].get(user_cache_key(user_id)))
+        with self.assertRaises(AuthenticationFailed):
+            self.auth.get_user(self.token)
@@ -0,0 +1,27 @@
+"""
+User Management Tokens
+Location: apps/users/tokens.py
+
+JWT helpers for the authentication endpoints.
+"""
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+def issue_token_pair(user):
+    """
+    Issue an access/refresh token pair for a user
+    
+    Claims come from simplejwt's RefreshToken.for_user, so every
+    SIMPLE_JWT setting it honors applies here too. With the
+    blacklist app installed, for_user also records the refresh
+    token as outstanding so logout can blacklist it.
+    
+    Args:
+        user: User to issue tokens for
+    
+    Returns:
+        tuple: (access, refresh) encoded token strings
+    """
+    refresh = RefreshToken.for_user(user)
+    return str(refresh.access_token), str(refresh)
@@ -0,0 +1,49 @@
+"""
+User Management Validators
+Location: apps/users/validators.py
+
+Reusable field validators for user-related serializers.
+"""
+
+import re
+
+from rest_framework import serializers
+
+
+# Characters ignored in phone numbers (spaces and dashes)
+_PHONE_STRIP = str.maketrans('', '', ' -')
+
+# Optional leading + followed by 10-15 digits
+_PHONE_RE = re.compile(r'^\+?\d{10,15}$')
+
+
+def validate_phone(value):
+    """
+    Validate phone number format (optional but basic validation)
+    
+    Args:
+        value (str): Phone number to validate
+        
+    Returns:
+        str: Validated phone number
+        
+    Raises:
+        ValidationError: If phone format is invalid
+    """
+    if not value:
+        return value
+    
+    cleaned_phone = value.translate(_PHONE_STRIP)
+    if _PHONE_RE.match(cleaned_phone):
+        return value
+    
+    # Invalid - work out which rule failed for the error message
+    # At most one leading + is allowed, so strip only one
+    digits = cleaned_phone[1:] if cleaned_phone.startswith('+') else cleaned_phone
+    if not digits.isdigit():
+        raise serializers.ValidationError(
+            "Phone number must contain only digits."
+        )
+    raise serializers.ValidationError(
+        "Phone number must be between 10 and 15 digits."
+    )
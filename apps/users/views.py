@@ -9,8 +9,11 @@ Views handle HTTP requests and return appropriate responses.
 """
 
 from rest_framework import status, generics, permissions, authentication
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import get_user_model
@@ -18,6 +21,8 @@ from drf_yasg.utils import swagger_auto_schema
 from drf_yasg import openapi
 import logging
 
+from utils.parsers import ORJSONParser
+
 from .serializers import (
     UserSerializer,
     UserRegistrationSerializer,
@@ -26,11 +31,39 @@ from .serializers import (
     UserUpdateSerializer,
     UserListSerializer
 )
+from .pagination import UserCursorPagination
 from .permissions import IsOwnerOrAdmin
+from .tokens import issue_token_pair
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Unbound serializers reused across requests; their fields are built once
+_USER_REPR = UserSerializer()
+_USER_LIST_REPR = UserListSerializer()
+
+
+def _auth_user_payload(user):
+    """
+    Build the user block returned by register and login
+    
+    The shape is fixed, so it is built directly instead of running
+    the full UserSerializer a second time after validation.
+    
+    Args:
+        user: Authenticated or newly created user
+        
+    Returns:
+        dict: Basic user fields
+    """
+    return {
+        'id': user.id,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'role': user.role,
+    }
+
 
 class UserRegistrationView(generics.CreateAPIView):
     """
@@ -59,7 +92,8 @@ class UserRegistrationView(generics.CreateAPIView):
                             "id": 1,
                             "email": "user@example.com",
                             "first_name": "John",
-                            "last_name": "Doe"
+                            "last_name": "Doe",
+                            "role": "customer"
                         },
                         "tokens": {
                             "access": "eyJ0eXAiOiJKV1QiLCJhbGc...",
@@ -86,16 +120,16 @@ class UserRegistrationView(generics.CreateAPIView):
         user = serializer.save()
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        access, refresh = issue_token_pair(user)
         
-        logger.info(f"New user registered: {user.email}")
+        logger.info("New user registered: %s", user.email)
         
         return Response({
             'message': 'User registered successfully',
-            'user': UserSerializer(user).data,
+            'user': _auth_user_payload(user),
             'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
+                'refresh': refresh,
+                'access': access,
             }
         }, status=status.HTTP_201_CREATED)
 
@@ -124,6 +158,8 @@ class UserLoginView(APIView):
                         "user": {
                             "id": 1,
                             "email": "user@example.com",
+                            "first_name": "John",
+                            "last_name": "Doe",
                             "role": "customer"
                         },
                         "tokens": {
@@ -155,16 +191,16 @@ class UserLoginView(APIView):
         user = serializer.validated_data['user']
         
         # Generate JWT tokens
-        refresh = RefreshToken.for_user(user)
+        access, refresh = issue_token_pair(user)
         
-        logger.info(f"User logged in: {user.email}")
+        logger.info("User logged in: %s", user.email)
         
         return Response({
             'message': 'Login successful',
-            'user': UserSerializer(user).data,
+            'user': _auth_user_payload(user),
             'tokens': {
-                'refresh': str(refresh),
-                'access': str(refresh.access_token),
+                'refresh': refresh,
+                'access': access,
             }
         }, status=status.HTTP_200_OK)
 
@@ -183,6 +219,8 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     
     serializer_class = UserUpdateSerializer
     permission_classes = [permissions.IsAuthenticated]
+    # profile.avatar arrives as a multipart upload
+    parser_classes = [ORJSONParser, MultiPartParser]
     
     def get_object(self):
         """Get the current authenticated user"""
@@ -206,10 +244,9 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
             Response: User profile data
         """
         instance = self.get_object()
-        serializer = UserSerializer(instance)
         return Response({
             'message': 'Profile retrieved successfully',
-            'user': serializer.data
+            'user': _USER_REPR.to_representation(instance)
         })
     
     @swagger_auto_schema(
@@ -240,11 +277,11 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
         serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
         
-        logger.info(f"User profile updated: {instance.email}")
+        logger.info("User profile updated: %s", instance.email)
         
         return Response({
             'message': 'Profile updated successfully',
-            'user': UserSerializer(instance).data
+            'user': _USER_REPR.to_representation(serializer.instance)
         })
 
 
@@ -288,13 +325,36 @@ class ChangePasswordView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
         
-        logger.info(f"Password changed for user: {request.user.email}")
+        logger.info("Password changed for user: %s", request.user.email)
         
         return Response({
             'message': 'Password changed successfully'
         }, status=status.HTTP_200_OK)
 
 
+def _get_refresh_token(data):
+    """
+    Extract the refresh token from a logout request body
+    
+    Args:
+        data: Parsed request body
+        
+    Returns:
+        str: Refresh token, or None when the body has none
+        
+    Raises:
+        ValidationError: If the body is not an object
+    """
+    if not isinstance(data, dict):
+        raise ValidationError({
+            'non_field_errors': [
+                'Invalid data. Expected a dictionary, '
+                f'but got {type(data).__name__}.'
+            ]
+        })
+    return data.get('refresh_token')
+
+
 class UserLogoutView(APIView):
     """
     API endpoint for user logout
@@ -329,22 +389,21 @@ class UserLogoutView(APIView):
         Handle user logout
 
         """
-        try:
-            refresh_token = request.data.get("refresh_token")
-            if refresh_token:
-                token = RefreshToken(refresh_token)
-                token.blacklist()
-            
-            logger.info(f"User logged out: {request.user.email}")
-            
-            return Response({
-                'message': 'Logout successful'
-            }, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Logout error: {str(e)}")
-            return Response({
-                'error': 'Invalid token'
-            }, status=status.HTTP_400_BAD_REQUEST)
+        refresh_token = _get_refresh_token(request.data)
+        if refresh_token:
+            try:
+                RefreshToken(refresh_token).blacklist()
+            except (TokenError, InvalidToken) as e:
+                logger.error("Logout error: %s", e)
+                return Response({
+                    'error': 'Invalid token'
+                }, status=status.HTTP_400_BAD_REQUEST)
+        
+        logger.info("User logged out: %s", request.user.email)
+        
+        return Response({
+            'message': 'Logout successful'
+        }, status=status.HTTP_200_OK)
 
 
 class UserDetailView(generics.RetrieveAPIView):
@@ -359,7 +418,8 @@ class UserDetailView(generics.RetrieveAPIView):
     
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrAdmin]
-    queryset = User.objects.all()
+    # Nested profile is rendered on detail only; join it in the same query
+    queryset = User.objects.select_related('profile')
     
     @swagger_auto_schema(
         operation_description="Get user details by ID",
@@ -382,30 +442,46 @@ class UserListView(generics.ListAPIView):
     GET /api/users/
     
     Admins can list all users. Regular users can only see themselves.
-    Supports pagination, search, and filtering.
+    Supports cursor pagination, search, and filtering.
     Requires authentication.
     """
     
     serializer_class = UserListSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = UserCursorPagination
     # authentication_classes = [authentication.TokenAuthentication]
     search_fields = ['email', 'first_name', 'last_name', 'phone']
     filterset_fields = ['role', 'is_active', 'is_verified']
-    ordering_fields = ['date_joined', 'email']
-    ordering = ['-date_joined']
+    # Only immutable columns make stable cursor positions
+    ordering_fields = ['date_joined']
+    # Read by OrderingFilter, which cursor pagination asks for the
+    # ordering; matches the queryset and idx_users_date_joined
+    ordering = ('-date_joined', '-id')
     
     def get_queryset(self):
         """
         Get queryset based on user role
         
         Admins see all users, regular users see only themselves.
+        Only the columns UserListSerializer reads are fetched, in
+        idx_users_date_joined order.
         
         Returns:
             QuerySet: Filtered user queryset
         """
+        queryset = User.objects.only(
+            'id',
+            'email',
+            'first_name',
+            'last_name',
+            'role',
+            'is_active',
+            'date_joined'
+        ).order_by('-date_joined', '-id')
+        
         if self.request.user.is_admin or self.request.user.is_staff:
-            return User.objects.all()
-        return User.objects.filter(id=self.request.user.id)
+            return queryset
+        return queryset.filter(id=self.request.user.id)
 
         # user = self.request.user
         # if user.is_authenticated and (user.is_superuser or user.is_staff or user.is_admin):
@@ -424,6 +500,29 @@ class UserListView(generics.ListAPIView):
     def get(self, request, *args, **kwargs):
         """List users"""
         return super().get(request, *args, **kwargs)
+    
+    def list(self, request, *args, **kwargs):
+        """
+        List users, answering plain non-admin requests from memory
+        
+        A regular user only ever sees themselves. Without search,
+        filter or cursor parameters the single row is request.user,
+        so it is serialized directly in the paginated shape.
+        
+        Args:
+            request: HTTP request
+            
+        Returns:
+            Response: Paginated user list
+        """
+        user = request.user
+        if not (user.is_admin or user.is_staff) and not request.query_params:
+            return Response({
+                'next': None,
+                'previous': None,
+                'results': [_USER_LIST_REPR.to_representation(user)]
+            })
+        return super().list(request, *args, **kwargs)
 
 
 class UserDeleteView(generics.DestroyAPIView):
@@ -457,7 +556,7 @@ class UserDeleteView(generics.DestroyAPIView):
         email = instance.email
         self.perform_destroy(instance)
         
-        logger.info(f"User deleted by admin: {email}")
+        logger.info("User deleted by admin: %s", email)
         
         return Response({
             'message': f'User {email} deleted successfully'
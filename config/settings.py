@@ -4,11 +4,32 @@
 from pathlib import Path
 from datetime import timedelta
 from decouple import config as env_config
+from django.core.exceptions import ImproperlyConfigured
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
+# Fail fast on missing required variables, reporting all of them at once
+# instead of one UndefinedValueError per restart
+REQUIRED_ENV_VARS = (
+    'SECRET_KEY',
+    'DB_NAME',
+    'DB_USER',
+    'DB_PASSWORD',
+    'DB_HOST',
+    'DB_PORT',
+)
+_missing_env = [
+    name for name in REQUIRED_ENV_VARS
+    if not env_config(name, default='')
+]
+if _missing_env:
+    raise ImproperlyConfigured(
+        'Missing required environment variables: ' + ', '.join(_missing_env)
+    )
+
+
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = env_config('SECRET_KEY')
@@ -44,6 +65,7 @@ INSTALLED_APPS = [
     
     
     # Local apps
+    'apps.core',
     'apps.users',
     'apps.products', 
     'apps.orders',    
@@ -94,6 +116,18 @@ DATABASES = {
         'PASSWORD': env_config('DB_PASSWORD'),
         'HOST': env_config('DB_HOST'),
         'PORT': env_config('DB_PORT'),
+        
+        # Keep connections open between requests instead of reconnecting
+        'CONN_MAX_AGE': env_config('CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        # Required when DB_HOST points at pgbouncer in transaction mode
+        'DISABLE_SERVER_SIDE_CURSORS': env_config(
+            'DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool
+        ),
+        'OPTIONS': {
+            'application_name': 'ecommerce-api',
+            'sslmode': env_config('DB_SSLMODE', default='prefer'),
+        },
 
         'TEST': {
             'NAME': 'test_ecommerce_db',  
@@ -157,7 +191,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 REST_FRAMEWORK = {
     # Authentication
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'apps.users.authentication.CachedJWTAuthentication',
     ),
     
     # Permissions
@@ -180,23 +214,22 @@ REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'utils.exceptions.custom_exception_handler',
     
     # Renderer
-    'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
-    ],
+    'DEFAULT_RENDERER_CLASSES': (
+        'utils.renderers.ORJSONRenderer',
+    ),
     
     # Parser
+    # JSON only; upload and callback views declare their own parsers
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
-        'rest_framework.parsers.MultiPartParser',
-        'rest_framework.parsers.FormParser',
+        'utils.parsers.ORJSONParser',
     ],
 }
 
 
-# Add browsable API renderer in debug mode
-if DEBUG:
-    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append(
-        'rest_framework.renderers.BrowsableAPIRenderer'
+# Add browsable API renderer in debug mode, only when explicitly enabled
+if DEBUG and env_config('ENABLE_BROWSABLE_API', default=False, cast=bool):
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] += (
+        'rest_framework.renderers.BrowsableAPIRenderer',
     )
 
 
@@ -271,7 +304,9 @@ CACHES = {
         'LOCATION': env_config('REDIS_URL', default='redis://localhost:6379/1'),
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
-            # 'PARSER_CLASS': 'redis.connection.HiredisParser',
+            # redis-py picks the hiredis parser automatically when the
+            # hiredis package is installed (see requirements.txt)
+            'SERIALIZER': 'django_redis.serializers.msgpack.MSGPackSerializer',
             'POOL_CLASS': 'redis.BlockingConnectionPool',
             'POOL_CLASS_KWARGS': {
                 'max_connections': 50,
@@ -284,7 +319,29 @@ CACHES = {
             'SOCKET_CONNECT_TIMEOUT': 5,
             'SOCKET_TIMEOUT': 5,
         }
-    }
+    },
+    # Authenticated users for CachedJWTAuthentication; model instances
+    # need pickle, which msgpack on the default alias cannot carry
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env_config('REDIS_URL', default='redis://localhost:6379/1'),
+        'KEY_PREFIX': 'auth',
+        'OPTIONS': {
+            'socket_connect_timeout': 5,
+            'socket_timeout': 5,
+        }
+    },
+    # Cached swagger/redoc responses (config/urls.py); HttpResponse
+    # objects need pickle, which msgpack on the default alias cannot carry
+    'schema': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': env_config('REDIS_URL', default='redis://localhost:6379/1'),
+        'KEY_PREFIX': 'schema',
+        'OPTIONS': {
+            'socket_connect_timeout': 5,
+            'socket_timeout': 5,
+        }
+    },
 }
 
 
@@ -347,6 +404,7 @@ LOGGING = {
             'filename': BASE_DIR / 'logs' / 'debug.log',
             'maxBytes': 1024 * 1024 * 5,  # 5 MB
             'backupCount': 5,
+            'delay': True,  # open on first write; apps.core creates logs/
             'formatter': 'verbose',
         },
         'error_file': {
@@ -355,32 +413,47 @@ LOGGING = {
             'filename': BASE_DIR / 'logs' / 'error.log',
             'maxBytes': 1024 * 1024 * 5,  # 5 MB
             'backupCount': 5,
+            'delay': True,  # open on first write; apps.core creates logs/
             'formatter': 'verbose',
         },
+        # Loggers only enqueue records; a listener thread per queue
+        # writes them to the handlers above
+        'queue_default': {
+            '()': 'utils.log_handlers.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.file'],
+        },
+        'queue_errors': {
+            '()': 'utils.log_handlers.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.error_file'],
+        },
     },
     'loggers': {
         'django': {
-            'handlers': ['console', 'file'],
+            'handlers': ['queue_default'],
             'level': 'INFO',
             'propagate': False,
         },
         'django.request': {
-            'handlers': ['console', 'error_file'],
+            'handlers': ['queue_errors'],
             'level': 'ERROR',
             'propagate': False,
         },
+        # API error handler (utils.exceptions): 4xx at WARNING reach the
+        # console only, 5xx at ERROR also go to error.log
+        'utils': {
+            'handlers': ['queue_errors'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
         'apps': {
-            'handlers': ['console', 'file'],
-            'level': 'INFO',
+            'handlers': ['queue_default'],
+            # Raise to WARNING in production to drop per-request info records
+            'level': env_config('APP_LOG_LEVEL', default='INFO'),
             'propagate': False,
         },
     },
 }
 
-# Create logs directory if it doesn't exist
-import os
-os.makedirs(BASE_DIR / 'logs', exist_ok=True)
-
 
 # ---------Swagger/OpenAPI Settings-------------
 
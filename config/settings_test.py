@@ -0,0 +1,57 @@
+"""
+Test Settings
+Location: config/settings_test.py
+
+Overrides of the main settings for running the test suite.
+
+Usage:
+    python manage.py test --settings=config.settings_test
+"""
+
+import logging
+
+from .settings import *  # noqa: F401,F403
+
+
+# Password hashing
+# PBKDF2 is deliberately slow and dominates test run time;
+# tests never need a strong hash.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
+
+
+# JWT
+# A fixed key keeps token signing independent of the SECRET_KEY in .env
+SIMPLE_JWT = {
+    **SIMPLE_JWT,  # noqa: F405
+    'ALGORITHM': 'HS256',
+    'SIGNING_KEY': 'test-signing-key-not-for-production-use',
+}
+
+
+# Logging
+# Views log on every request; formatting and writing those records to the
+# rotating files only slows the suite down.
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': True,
+}
+logging.disable(logging.CRITICAL)
+
+
+# Cache
+# In-process caches keep the suite independent of a running Redis
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'auth': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth',
+    },
+    'schema': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'schema',
+    },
+}
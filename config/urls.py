@@ -53,6 +53,14 @@ schema_view = get_schema_view(
     permission_classes=(permissions.AllowAny,),
 )
 
+# Generated schema is served from the cache instead of being rebuilt
+# by introspecting every view on each docs request. Uses the pickle-backed
+# 'schema' alias: cache_page stores whole HttpResponse objects
+SCHEMA_CACHE = {
+    'cache_timeout': settings.CACHE_TTL,
+    'cache_kwargs': {'cache': 'schema', 'key_prefix': 'swagger'},
+}
+
 # ==================================================
 # URL Patterns
 # ==================================================
@@ -68,22 +76,22 @@ urlpatterns = [
     # ============================================
     path(
         'swagger/',
-        schema_view.with_ui('swagger', cache_timeout=0),
+        schema_view.with_ui('swagger', **SCHEMA_CACHE),
         name='schema-swagger-ui'
     ),
     path(
         'redoc/',
-        schema_view.with_ui('redoc', cache_timeout=0),
+        schema_view.with_ui('redoc', **SCHEMA_CACHE),
         name='schema-redoc'
     ),
     path(
         'swagger.json',
-        schema_view.without_ui(cache_timeout=0),
+        schema_view.without_ui(**SCHEMA_CACHE),
         name='schema-json'
     ),
     path(
         'swagger.yaml',
-        schema_view.without_ui(cache_timeout=0),
+        schema_view.without_ui(**SCHEMA_CACHE),
         name='schema-yaml'
     ),
     
@@ -7,13 +7,59 @@ Provides consistent error response format across the API.
 
 from rest_framework.views import exception_handler
 from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from rest_framework import status
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.http import Http404
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_ERROR_MESSAGE = 'An error occurred'
+
+# Distinguishes a missing 'detail' key from an explicit None value
+_MISSING = object()
+
+# Exceptions reported as 404 when DRF leaves them unhandled
+_NOT_FOUND_TYPES = (ObjectDoesNotExist, Http404)
+
+# Shared bodies for the detail-less 404 and production 500 responses;
+# never mutate these, they are reused across requests
+_NOT_FOUND_BODY = {
+    'success': False,
+    'status': status.HTTP_404_NOT_FOUND,
+    'error': {
+        'message': 'Resource not found',
+        'details': None
+    }
+}
+_SERVER_ERROR_BODY = {
+    'success': False,
+    'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
+    'error': {
+        'message': 'Internal server error',
+        'details': None
+    }
+}
+
+
+class _LazyStr:
+    """
+    Defer str(obj) until a log record is actually formatted
+    
+    Passed as a logging argument or extra value so filtered
+    records never pay for the conversion.
+    """
+    
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self):
+        return str(self.obj)
+
 
 def custom_exception_handler(exc, context):
     """
@@ -24,6 +70,7 @@ def custom_exception_handler(exc, context):
     Response format:
     {
         "success": false,
+        "status": 400,  // HTTP status code
         "error": {
             "message": "Error message",
             "details": {...}  // Optional
@@ -42,80 +89,80 @@ def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
     
     if response is not None:
-        custom_response_data = {
-            'success': False,
-            'error': {
-                'message': None,
-                'details': None
-            }
-        }
+        data = response.data
+        details = None
         
         # Handle validation errors
         if isinstance(exc, ValidationError):
-            custom_response_data['error']['message'] = 'Validation Error'
-            custom_response_data['error']['details'] = response.data
+            message = 'Validation Error'
+            details = data
         
-        # Handle other exceptions
-        else:
-            # Get error message
-            if isinstance(response.data, dict):
-                if 'detail' in response.data:
-                    custom_response_data['error']['message'] = response.data['detail']
-                elif 'non_field_errors' in response.data:
-                    custom_response_data['error']['message'] = response.data['non_field_errors'][0]
+        # Handle other exceptions, by shape of the default error body
+        elif isinstance(data, dict):
+            message = data.get('detail', _MISSING)
+            if message is _MISSING:
+                non_field_errors = data.get('non_field_errors')
+                if non_field_errors:
+                    message = non_field_errors[0]
                 else:
-                    custom_response_data['error']['message'] = 'An error occurred'
-                    custom_response_data['error']['details'] = response.data
-            elif isinstance(response.data, list):
-                custom_response_data['error']['message'] = response.data[0] if response.data else 'An error occurred'
-            else:
-                custom_response_data['error']['message'] = str(response.data)
+                    message = DEFAULT_ERROR_MESSAGE
+                    details = data
+        elif isinstance(data, list):
+            message = data[0] if data else DEFAULT_ERROR_MESSAGE
+        else:
+            message = str(data)
         
-        response.data = custom_response_data
+        response.data = {
+            'success': False,
+            'status': response.status_code,
+            'error': {
+                'message': message,
+                'details': details
+            }
+        }
         
-        # Log the error
-        logger.error(
-            f"API Error [{response.status_code}]: {custom_response_data['error']['message']}",
+        # Client errors are expected traffic; only 5xx reach error.log
+        logger.log(
+            logging.ERROR if response.status_code >= 500 else logging.WARNING,
+            "API Error [%s]: %s",
+            response.status_code,
+            message,
             extra={
                 'context': context,
-                'exception': str(exc)
+                'exception': _LazyStr(exc)
             }
         )
     
     # Handle unexpected errors (ObjectDoesNotExist, Http404)
-    elif isinstance(exc, (ObjectDoesNotExist, Http404)):
-        from rest_framework.response import Response
-        
-        custom_response_data = {
+    elif isinstance(exc, _NOT_FOUND_TYPES):
+        detail = str(exc)
+        body = _NOT_FOUND_BODY if not detail else {
             'success': False,
+            'status': status.HTTP_404_NOT_FOUND,
             'error': {
                 'message': 'Resource not found',
-                'details': str(exc) if str(exc) else None
+                'details': detail
             }
         }
-        response = Response(custom_response_data, status=status.HTTP_404_NOT_FOUND)
-        logger.error(f"Resource not found: {str(exc)}")
+        response = Response(body, status=status.HTTP_404_NOT_FOUND)
+        logger.warning("Resource not found: %s", detail)
     
     # Handle other unexpected exceptions
     elif exc:
-        from rest_framework.response import Response
-        
-        custom_response_data = {
+        body = _SERVER_ERROR_BODY if not settings.DEBUG else {
             'success': False,
+            'status': status.HTTP_500_INTERNAL_SERVER_ERROR,
             'error': {
                 'message': 'Internal server error',
-                'details': str(exc) if settings.DEBUG else None
+                'details': str(exc)
             }
         }
-        response = Response(custom_response_data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        response = Response(body, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         logger.error(
-            f"Unexpected error: {str(exc)}",
+            "Unexpected error: %s",
+            exc,
             exc_info=True,
             extra={'context': context}
         )
     
     return response
-
-
-# Import settings for DEBUG check
-from django.conf import settings
\ No newline at end of file
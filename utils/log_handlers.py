@@ -0,0 +1,70 @@
+"""
+Logging Handlers
+Location: utils/log_handlers.py
+
+Queue-based handler that moves log I/O off the request thread.
+"""
+
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+import atexit
+import copy
+
+
+class QueueListenerHandler(QueueHandler):
+    """
+    QueueHandler that owns a QueueListener for its target handlers
+    
+    Logging calls only enqueue the record; a background thread
+    hands it to the real handlers (console, rotating files).
+    Python 3.11's dictConfig cannot wire a QueueListener itself,
+    so this class is used through the '()' factory key:
+    
+        'queue': {
+            '()': 'utils.log_handlers.QueueListenerHandler',
+            'handlers': ['cfg://handlers.console', 'cfg://handlers.file'],
+        }
+    
+    The target handlers must sort before this handler's name,
+    since dictConfig configures handlers alphabetically.
+    """
+    
+    def __init__(self, handlers, respect_handler_level=True):
+        """
+        Start the listener for the given handlers
+        
+        Args:
+            handlers: Target handlers, usually cfg:// references
+            respect_handler_level (bool): Apply each target's level
+        """
+        super().__init__(SimpleQueue())
+        # Index access makes dictConfig resolve the cfg:// references
+        targets = [handlers[i] for i in range(len(handlers))]
+        self.listener = QueueListener(
+            self.queue,
+            *targets,
+            respect_handler_level=respect_handler_level
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+    
+    def prepare(self, record):
+        """
+        Prepare a record for the queue without formatting tracebacks
+        
+        The stock QueueHandler formats the whole record, including
+        exc_info, on the calling thread. The queue never leaves the
+        process, so the traceback is left for the listener thread's
+        handlers to format. The message itself is merged now so later
+        changes to its arguments cannot alter it.
+        
+        Args:
+            record: Log record being enqueued
+            
+        Returns:
+            LogRecord: Copy safe to hand to the listener
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
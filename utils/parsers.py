@@ -0,0 +1,39 @@
+"""
+Custom Parsers
+Location: utils/parsers.py
+
+orjson-backed parser for faster JSON request decoding.
+"""
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+import orjson
+
+
+class ORJSONParser(JSONParser):
+    """
+    JSON parser using orjson instead of the stdlib json module
+    
+    orjson reads UTF-8 bytes directly and rejects NaN/Infinity,
+    matching DRF's default STRICT_JSON behaviour.
+    """
+    
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parse a JSON request body
+        
+        Args:
+            stream: Request body stream
+            media_type (str): Request content type
+            parser_context (dict): View, request and arguments
+            
+        Returns:
+            Parsed JSON data
+            
+        Raises:
+            ParseError: Body is not valid JSON
+        """
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
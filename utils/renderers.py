@@ -0,0 +1,44 @@
+"""
+Custom Renderers
+Location: utils/renderers.py
+
+orjson-backed renderer for faster JSON response encoding.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+import orjson
+
+# DRF's encoder handles the types orjson does not (Decimal, lazy strings, ...)
+_drf_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer using orjson instead of the stdlib json module
+    
+    Datetimes and types unknown to orjson are passed to DRF's
+    JSONEncoder, so output matches the default JSONRenderer.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render data into JSON bytes
+        
+        Args:
+            data: Response data
+            accepted_media_type (str): Negotiated media type
+            renderer_context (dict): View, request and response
+            
+        Returns:
+            bytes: Encoded JSON
+        """
+        if data is None:
+            return b''
+        
+        # Non-string keys (e.g. integer ids) are stringified as json.dumps does
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        
+        return orjson.dumps(data, default=_drf_encoder.default, option=option)